@@ -8,25 +8,131 @@ Captures all device data needed for uc-intg-musiccast v2.0.x development.
 :license: MPL-2.0, see LICENSE for more details.
 """
 
+import argparse
+import asyncio
+import hashlib
+import ipaddress
 import json
+import os
 import sys
 import time
 from datetime import datetime
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
 from urllib.parse import urlencode
 
+import aiohttp
+
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dump_bytes(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dump_bytes(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+# Maximum number of in-flight probe requests. Keeps the device from being
+# overwhelmed while still overlapping round-trip latency.
+MAX_CONCURRENT_PROBES = 8
+
+# Built once; a fresh ClientTimeout and headers dict per probe is avoidable
+# allocation on the hot path.
+_REQUEST_HEADERS = {"User-Agent": "MusicCast-Discovery/2.1"}
+_DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# On-disk cache TTLs per endpoint volatility: capability-style responses are
+# stable across developer iterations, status-style ones go stale quickly.
+_CACHE_TTL_LONG = 3600
+_CACHE_TTL_SHORT = 30
+_LONG_TTL_ENDPOINTS = frozenset({
+    "system/getDeviceInfo",
+    "system/getFeatures",
+    "netusb/getPresetInfo",
+})
+
+
+def _cache_key(endpoint, query):
+    return hashlib.blake2b(f"{endpoint}|{query or ''}".encode(), digest_size=16).hexdigest()
+
+
+def _probe(endpoint, params, label):
+    """Pre-encode the query string so the hot probe path skips urlencode."""
+    return (endpoint, params, urlencode(params) if params else "", label)
+
+
+# (category, banner, ((endpoint, params, query, label), ...)) — one immutable
+# table drives all command-format probing in test_commands.
+PROBE_TABLE = (
+    ("repeat_shuffle", "Repeat/Shuffle commands:", (
+        _probe("netusb/setRepeat", {"repeat": "off"}, "setRepeat repeat=off"),
+        _probe("netusb/setRepeat", {"repeat": "one"}, "setRepeat repeat=one"),
+        _probe("netusb/setRepeat", {"repeat": "all"}, "setRepeat repeat=all"),
+        _probe("netusb/setShuffle", {"shuffle": "off"}, "setShuffle shuffle=off"),
+        _probe("netusb/setShuffle", {"shuffle": "on"}, "setShuffle shuffle=on"),
+        _probe("netusb/toggleRepeat", None, "toggleRepeat (no params)"),
+        _probe("netusb/toggleShuffle", None, "toggleShuffle (no params)"),
+    )),
+    ("volume", "Volume commands:", (
+        _probe("main/setVolume", {"volume": "up", "step": 1}, "volume=up&step=1"),
+        _probe("main/setVolume", {"volume": "down", "step": 1}, "volume=down&step=1"),
+        _probe("main/setVolume", {"step": 1}, "step=1"),
+        _probe("main/setVolume", {"step": -1}, "step=-1"),
+    )),
+    ("playback", "Playback commands:", (
+        _probe("netusb/setPlayback", {"playback": "toggle"}, "playback=toggle"),
+        _probe("netusb/setPlayback", {"playback": "play"}, "playback=play"),
+        _probe("netusb/setPlayback", {"playback": "pause"}, "playback=pause"),
+        _probe("netusb/setPlayback", {"playback": "stop"}, "playback=stop"),
+    )),
+)
+
 
 class MusicCastDiscovery:
     """MusicCast device discovery for uc-intg-musiccast v2.0.x."""
 
-    def __init__(self):
+    def __init__(self, exhaustive=False, concurrency=MAX_CONCURRENT_PROBES, output_dir=".",
+                 read_only=False):
+        self.exhaustive = exhaustive
+        # Every PROBE_TABLE entry is a set*/toggle* call that mutates device
+        # state; --read-only skips the whole phase for non-intrusive runs.
+        self.read_only = read_only
+        self.concurrency = concurrency
+        self.output_dir = output_dir
         self.device_ip = None
         self.base_url = None
         self.api_base = None
+        self._url_prefix = None
         self.device_info = {}
+        # Captured once: the report timestamp and output filename both derive
+        # from discovery start, which also groups multi-device batch outputs.
+        self._start = datetime.now()
+        self._semaphore = None
+        # Set after the connection test measures the device's actual RTT;
+        # failing probes then time out quickly instead of waiting the full 10s.
+        self._adaptive_timeout = None
+        self._named_preset_count = 0
+        # (endpoint, query) -> fully built URL; endpoints are re-probed with
+        # the same handful of query strings, so format each URL only once.
+        self._url_cache = {}
+        # Memo for idempotent get* endpoints: (endpoint, query) -> response.
+        # Repeated queries (e.g. getDeviceInfo from the connection test) are
+        # answered without another round trip to the device.
+        self._response_cache = {}
+        # TTL-guarded copy persisted next to the reports so iterative
+        # developer re-runs skip the network for still-fresh responses.
+        self._disk_cache = {}
+        self._disk_cache_path = None
+        # Latched on a final connect failure: once the device has dropped
+        # off the network there is no point spending timeouts on the rest
+        # of the probe matrix.
+        self._unreachable = False
         self.data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._start.isoformat(),
             "script_version": "2.1.0",
             "integration_version": "2.0.x",
             "device_info": {},
@@ -62,6 +168,18 @@ class MusicCastDiscovery:
         print("=" * 70)
         print()
 
+    def set_device_ip(self, ip):
+        """Validate and adopt a device IP. Returns False for malformed input."""
+        try:
+            ipaddress.IPv4Address(ip)
+        except ValueError:
+            return False
+        self.device_ip = ip
+        self.base_url = f"http://{ip}"
+        self.api_base = f"{self.base_url}/YamahaExtendedControl/v1"
+        self._url_prefix = self.api_base + "/"
+        return True
+
     def get_device_ip(self):
         while True:
             try:
@@ -69,38 +187,110 @@ class MusicCastDiscovery:
                 if not ip:
                     print("  Please enter an IP address")
                     continue
-                parts = ip.split(".")
-                if len(parts) != 4 or not all(0 <= int(p) <= 255 for p in parts):
+                if not self.set_device_ip(ip):
                     print("  Invalid IP format. Use format: 192.168.1.100")
                     continue
-                self.device_ip = ip
-                self.base_url = f"http://{ip}"
-                self.api_base = f"{self.base_url}/YamahaExtendedControl/v1"
                 print(f"  Using device IP: {ip}")
                 return True
-            except (ValueError, KeyboardInterrupt):
-                if isinstance(sys.exc_info()[1], KeyboardInterrupt):
-                    print("\n  Cancelled by user")
-                    return False
-                print("  Invalid IP address. Use format: 192.168.1.100")
-
-    def make_request(self, endpoint, params=None, timeout=10):
-        url = f"{self.api_base}/{endpoint}"
-        if params:
-            url += "?" + urlencode(params)
+            except (KeyboardInterrupt, EOFError):
+                print("\n  Cancelled by user")
+                return False
+
+    @staticmethod
+    def _is_idempotent(endpoint):
+        return endpoint.rsplit("/", 1)[-1].startswith("get")
+
+    def _load_disk_cache(self):
+        self._disk_cache_path = os.path.join(self.output_dir, f".mc_cache_{self.device_ip}.json")
+        try:
+            with open(self._disk_cache_path, "rb") as f:
+                self._disk_cache = _json_loads(f.read())
+        except (OSError, ValueError):
+            self._disk_cache = {}
+
+    def _store_disk_cache(self):
+        if not self._disk_cache_path:
+            return
+        try:
+            with open(self._disk_cache_path, "wb") as f:
+                f.write(_json_dump_bytes(self._disk_cache))
+        except OSError:
+            pass
+
+    async def make_request(self, session, endpoint, params=None, timeout=None, query=None):
+        if self._unreachable:
+            return None
+        if query is None and params:
+            query = urlencode(params)
+
+        cache_key = None
+        if self._is_idempotent(endpoint):
+            cache_key = (endpoint, query)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            entry = self._disk_cache.get(_cache_key(endpoint, query))
+            if entry:
+                ttl = _CACHE_TTL_LONG if endpoint in _LONG_TTL_ENDPOINTS else _CACHE_TTL_SHORT
+                if time.time() - entry["t"] < ttl:
+                    self._response_cache[cache_key] = entry["v"]
+                    return entry["v"]
+
+        url_key = (endpoint, query)
+        url = self._url_cache.get(url_key)
+        if url is None:
+            url = self._url_prefix + endpoint
+            if query:
+                url += "?" + query
+            self._url_cache[url_key] = url
+        request_timeout = (aiohttp.ClientTimeout(total=timeout) if timeout
+                           else (self._adaptive_timeout or _DEFAULT_TIMEOUT))
         try:
-            request = Request(url)
-            request.add_header("User-Agent", "MusicCast-Discovery/2.1")
-            with urlopen(request, timeout=timeout) as response:
-                return json.loads(response.read().decode("utf-8"))
-        except (HTTPError, URLError, json.JSONDecodeError, Exception) as e:
+            async with self._semaphore:
+                # Transient connect failures and timeouts get a short
+                # exponential backoff (0.2s, 0.4s) before being declared
+                # failures; only the final attempt's error is recorded.
+                for attempt in range(3):
+                    try:
+                        async with session.get(url, timeout=request_timeout) as response:
+                            # bytes straight into the decoder; orjson accepts
+                            # them directly and skips the intermediate str copy.
+                            data = _json_loads(await response.read())
+                            if cache_key is not None:
+                                self._response_cache[cache_key] = data
+                                self._disk_cache[_cache_key(endpoint, query)] = {
+                                    "t": time.time(), "v": data,
+                                }
+                            return data
+                    except (aiohttp.ClientConnectorError, asyncio.TimeoutError):
+                        if attempt == 2:
+                            raise
+                        await asyncio.sleep(0.2 * (2 ** attempt))
+        except (aiohttp.ClientError, asyncio.TimeoutError, json.JSONDecodeError, Exception) as e:
+            if isinstance(e, aiohttp.ClientConnectorError):
+                self._unreachable = True
             self.data["errors"].append({"endpoint": endpoint, "params": params, "error": str(e)})
             return None
 
-    def test_connection(self):
+    async def test_connection(self, session):
         print("\n  Testing connection...")
-        response = self.make_request("system/getDeviceInfo")
+        # Cheap TCP reachability gate before any HTTP traffic: an unreachable
+        # device fails here within a second instead of timing out per probe.
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.device_ip, 80), timeout=1.0
+            )
+            writer.close()
+            await writer.wait_closed()
+        except (OSError, asyncio.TimeoutError):
+            print(f"  Device {self.device_ip} not reachable (TCP connect failed)")
+            return False
+
+        start = time.monotonic()
+        response = await self.make_request(session, "system/getDeviceInfo")
         if response and response.get("response_code") == 0:
+            rtt = time.monotonic() - start
+            self._adaptive_timeout = aiohttp.ClientTimeout(total=min(10.0, max(0.5, 5 * rtt)))
             self.device_info = response
             print(f"  Connected to: {response.get('model_name', 'Unknown')}")
             print(f"  Device ID: {response.get('device_id', 'Unknown')}")
@@ -113,9 +303,8 @@ class MusicCastDiscovery:
         print("\n[1/7] Device Info...")
         self.data["device_info"] = self.device_info
 
-    def collect_features(self):
+    def collect_features(self, response):
         print("[2/7] Features & Capabilities...")
-        response = self.make_request("system/getFeatures")
         if response:
             self.data["features"] = response
             zones = response.get("zone", [])
@@ -131,9 +320,8 @@ class MusicCastDiscovery:
         else:
             print("    Failed to get features")
 
-    def collect_status(self):
+    def collect_status(self, response):
         print("[3/7] Current Status...")
-        response = self.make_request("main/getStatus")
         if response:
             self.data["status"] = response
             print(f"    Power: {response.get('power')}, Input: {response.get('input')}, "
@@ -142,9 +330,8 @@ class MusicCastDiscovery:
         else:
             print("    Failed to get status")
 
-    def collect_play_info(self):
+    def collect_play_info(self, response):
         print("[4/7] Play Info...")
-        response = self.make_request("netusb/getPlayInfo")
         if response:
             self.data["play_info"] = response
             print(f"    Playback: {response.get('playback')}, "
@@ -156,145 +343,217 @@ class MusicCastDiscovery:
         else:
             print("    Failed to get play info")
 
-    def collect_preset_info(self):
+    @staticmethod
+    def _count_named_presets(presets):
+        named = 0
+        for key, value in presets.items():
+            if key == "response_code":
+                continue
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, dict) and item.get("text", "").strip():
+                        named += 1
+                    elif isinstance(item, list):
+                        for sub in item:
+                            if isinstance(sub, dict) and sub.get("text", "").strip():
+                                named += 1
+        return named
+
+    def collect_preset_info(self, response):
         print("[5/7] Preset Info (Favorites)...")
-        response = self.make_request("netusb/getPresetInfo")
         if response:
             self.data["preset_info"] = response
-            named = 0
-            for key, value in response.items():
-                if key == "response_code":
-                    continue
-                if isinstance(value, list):
-                    for item in value:
-                        if isinstance(item, dict) and item.get("text", "").strip():
-                            named += 1
-                        elif isinstance(item, list):
-                            for sub in item:
-                                if isinstance(sub, dict) and sub.get("text", "").strip():
-                                    named += 1
-            print(f"    Found {named} named presets")
+            self._named_preset_count = self._count_named_presets(response)
+            print(f"    Found {self._named_preset_count} named presets")
         else:
             print("    Failed to get preset info")
 
-    def collect_list_info(self):
+    async def collect_list_info(self, session):
         print("[6/7] List Browsing (net_radio, server, etc.)...")
         input_sources_to_test = ["net_radio", "server", "usb", "bluetooth", "spotify", "tidal", "deezer", "qobuz"]
 
         features = self.data.get("features", {})
-        available_inputs = []
+        # Same specialization as _prune_tests: a device that doesn't
+        # advertise the netusb section can't answer getListInfo at all, so
+        # don't spend round trips proving it source by source.
+        if features and "netusb" not in features:
+            print("    (skipped: netusb not supported per getFeatures)")
+            return
+
+        # Set from the start: membership below is O(1) and duplicate entries
+        # across the advertised list collapse without a later list(set(...)).
+        available_inputs = set()
         for z in features.get("zone", []):
             if z.get("id") == "main":
-                available_inputs = z.get("input_list", [])
+                available_inputs.update(z.get("input_list", []))
                 break
 
         sources_to_test = [s for s in input_sources_to_test if s in available_inputs]
         if not sources_to_test:
             sources_to_test = ["net_radio"]
 
-        list_results = {}
-        for source in sources_to_test:
-            print(f"    Testing getListInfo for '{source}'...")
-
+        async def probe_source(source):
             result = {"source": source, "attempts": []}
-
-            response = self.make_request("netusb/getListInfo", {"input": source, "index": 0, "size": 8, "lang": "en"})
+            response = await self.make_request(
+                session, "netusb/getListInfo",
+                {"input": source, "index": 0, "size": 8, "lang": "en"},
+            )
             result["attempts"].append({
                 "params": {"input": source, "index": 0, "size": 8, "lang": "en"},
                 "response": response,
             })
-            if response and response.get("response_code") == 0:
-                items = response.get("list_info", response.get("items", []))
-                print(f"      With input param: OK, {len(items) if isinstance(items, list) else '?'} items")
-            else:
-                code = response.get("response_code", "N/A") if response else "N/A"
-                print(f"      With input param: error code {code}")
-
-            response2 = self.make_request("netusb/getListInfo", {"index": 0, "size": 8, "lang": "en"})
-            result["attempts"].append({
-                "params": {"index": 0, "size": 8, "lang": "en"},
-                "response": response2,
-            })
-            if response2 and response2.get("response_code") == 0:
-                items = response2.get("list_info", response2.get("items", []))
-                print(f"      Without input param: OK, {len(items) if isinstance(items, list) else '?'} items")
-            else:
-                code = response2.get("response_code", "N/A") if response2 else "N/A"
-                print(f"      Without input param: error code {code}")
+            return result
+
+        # The no-input variant is byte-identical for every source, so issue
+        # it once and share the response across all per-source records.
+        # One multiplexed gather covers it and every per-source probe, so
+        # total wall time is one RTT batch rather than two sequential ones;
+        # the semaphore in make_request still caps in-flight requests.
+        no_input_params = {"index": 0, "size": 8, "lang": "en"}
+        shared_response, *results = await asyncio.gather(
+            self.make_request(session, "netusb/getListInfo", no_input_params),
+            *(probe_source(s) for s in sources_to_test),
+        )
+        for result in results:
+            result["attempts"].append({"params": no_input_params, "response": shared_response})
 
+        list_results = {}
+        lines = []
+        for source, result in zip(sources_to_test, results):
+            lines.append(f"    Testing getListInfo for '{source}'...")
+            for attempt, variant in zip(result["attempts"], ("With input param", "Without input param")):
+                response = attempt["response"]
+                if response and response.get("response_code") == 0:
+                    items = response.get("list_info", response.get("items", []))
+                    lines.append(f"      {variant}: OK, {len(items) if isinstance(items, list) else '?'} items")
+                else:
+                    code = response.get("response_code", "N/A") if response else "N/A"
+                    lines.append(f"      {variant}: error code {code}")
             list_results[source] = result
-            time.sleep(0.3)
+        sys.stdout.write("\n".join(lines) + "\n")
 
         self.data["list_info"] = list_results
 
-    def test_commands(self):
+    def _prune_tests(self, tests):
+        """Drop probes whose API section or function the device doesn't advertise.
+
+        getFeatures already tells us whether netusb exists and which functions
+        each zone supports, so there is no point issuing probes that are
+        guaranteed to fail.
+        """
+        features = self.data.get("features") or {}
+        if not features:
+            return tests
+
+        zones = {z.get("id"): z for z in features.get("zone", [])}
+        has_netusb = "netusb" in features
+
+        pruned = []
+        for test in tests:
+            endpoint = test[0]
+            section, _, func = endpoint.partition("/")
+            if section == "netusb" and not has_netusb:
+                continue
+            zone = zones.get(section)
+            if zone is not None:
+                func_list = zone.get("func_list", [])
+                if func == "setVolume" and func_list and "volume" not in func_list:
+                    continue
+            pruned.append(test)
+        return pruned
+
+    async def test_commands(self, session):
         print("[7/7] Testing Command Formats...")
 
-        print("  Repeat/Shuffle commands:")
-        repeat_shuffle_tests = [
-            ("netusb/setRepeat", {"repeat": "off"}, "setRepeat repeat=off"),
-            ("netusb/setRepeat", {"repeat": "one"}, "setRepeat repeat=one"),
-            ("netusb/setRepeat", {"repeat": "all"}, "setRepeat repeat=all"),
-            ("netusb/setShuffle", {"shuffle": "off"}, "setShuffle shuffle=off"),
-            ("netusb/setShuffle", {"shuffle": "on"}, "setShuffle shuffle=on"),
-            ("netusb/toggleRepeat", None, "toggleRepeat (no params)"),
-            ("netusb/toggleShuffle", None, "toggleShuffle (no params)"),
-        ]
-        for endpoint, params, label in repeat_shuffle_tests:
-            response = self.make_request(endpoint, params)
-            code = response.get("response_code", "N/A") if response else "N/A"
-            status = "OK" if code == 0 else f"error {code}"
-            print(f"    {label}: {status}")
-            self.data["command_tests"]["repeat_shuffle"].append({
-                "endpoint": endpoint, "params": params, "label": label,
-                "response_code": code, "works": code == 0,
-            })
-            time.sleep(0.3)
-
-        print("  Volume commands:")
-        volume_tests = [
-            ("main/setVolume", {"volume": "up", "step": 1}, "volume=up&step=1"),
-            ("main/setVolume", {"volume": "down", "step": 1}, "volume=down&step=1"),
-            ("main/setVolume", {"step": 1}, "step=1"),
-            ("main/setVolume", {"step": -1}, "step=-1"),
-        ]
-        for endpoint, params, label in volume_tests:
-            response = self.make_request(endpoint, params)
-            code = response.get("response_code", "N/A") if response else "N/A"
-            status = "OK" if code == 0 else f"error {code}"
-            print(f"    {label}: {status}")
-            self.data["command_tests"]["volume"].append({
-                "endpoint": endpoint, "params": params, "label": label,
-                "response_code": code, "works": code == 0,
-            })
-            time.sleep(0.3)
-
-        print("  Playback commands:")
-        playback_tests = [
-            ("netusb/setPlayback", {"playback": "toggle"}, "playback=toggle"),
-            ("netusb/setPlayback", {"playback": "play"}, "playback=play"),
-            ("netusb/setPlayback", {"playback": "pause"}, "playback=pause"),
-            ("netusb/setPlayback", {"playback": "stop"}, "playback=stop"),
+        if self.read_only:
+            print("  (skipped: --read-only, all command probes mutate device state)")
+            return
+
+        categories = [
+            (category, banner, self._prune_tests(tests))
+            for category, banner, tests in PROBE_TABLE
         ]
-        for endpoint, params, label in playback_tests:
-            response = self.make_request(endpoint, params)
-            code = response.get("response_code", "N/A") if response else "N/A"
-            status = "OK" if code == 0 else f"error {code}"
-            print(f"    {label}: {status}")
-            self.data["command_tests"]["playback"].append({
-                "endpoint": endpoint, "params": params, "label": label,
-                "response_code": code, "works": code == 0,
-            })
-            time.sleep(0.3)
+        results = await asyncio.gather(
+            *(self._probe_category(session, tests) for _, _, tests in categories)
+        )
+
+        # One buffered write instead of a print per probe; per-line flushes
+        # serialize on the stdout lock once probes run concurrently.
+        lines = []
+        for (category, banner, tests), category_results in zip(categories, results):
+            lines.append(f"  {banner}")
+            if not tests:
+                lines.append("    (skipped: not supported per getFeatures)")
+                continue
+            for endpoint, params, label, response in category_results:
+                lines.append(self._record_probe(category, endpoint, params, label, response))
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    async def _probe_category(self, session, tests):
+        """Probe one command category.
+
+        By default an endpoint is only probed until its first working
+        parameter format — one working format per command is all the
+        integration needs. --exhaustive restores the full concurrent matrix.
+        Distinct endpoints within a category (setRepeat, setShuffle, the
+        toggles) are independent and probed concurrently either way.
+        """
+        if self.exhaustive:
+            tasks = [
+                self.make_request(session, endpoint, params, query=query)
+                for endpoint, params, query, _ in tests
+            ]
+            responses = await asyncio.gather(*tasks, return_exceptions=True)
+            return [
+                (endpoint, params, label, None if isinstance(response, BaseException) else response)
+                for (endpoint, params, _, label), response in zip(tests, responses)
+            ]
+
+        groups = {}
+        for test in tests:
+            groups.setdefault(test[0], []).append(test)
+        group_results = await asyncio.gather(
+            *(self._probe_endpoint(session, group) for group in groups.values())
+        )
+        return [result for group in group_results for result in group]
+
+    async def _probe_endpoint(self, session, tests):
+        """Try one endpoint's parameter variants in order, stopping at the first success."""
+        results = []
+        for endpoint, params, query, label in tests:
+            response = await self.make_request(session, endpoint, params, query=query)
+            results.append((endpoint, params, label, response))
+            if response and response.get("response_code") == 0:
+                break
+        return results
+
+    def _record_probe(self, category, endpoint, params, label, response):
+        code = response.get("response_code", "N/A") if response else "N/A"
+        status = "OK" if code == 0 else f"error {code}"
+        self.data["command_tests"][category].append({
+            "endpoint": endpoint, "params": params, "label": label,
+            "response_code": code, "works": code == 0,
+        })
+        return f"    {label}: {status}"
 
     def save_results(self):
         print("\n  Saving results...")
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = self._start.strftime("%Y%m%d_%H%M%S")
         model = self.device_info.get("model_name", "Unknown").replace(" ", "_")
-        filename = f"musiccast_discovery_{model}_{timestamp}.json"
+        filename = os.path.join(self.output_dir, f"musiccast_discovery_{model}_{timestamp}.json")
         try:
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(self.data, f, indent=2, ensure_ascii=False)
+            # Stream the report one top-level section at a time: peak memory
+            # is bounded by the largest section, not the whole document, and
+            # writing bytes avoids the encode/decode round trip of text mode.
+            with open(filename, "wb") as f:
+                f.write(b"{")
+                for i, (key, value) in enumerate(self.data.items()):
+                    if i:
+                        f.write(b",")
+                    f.write(b"\n  " + _json_dump_bytes(key) + b": ")
+                    f.write(_json_dump_bytes(value).replace(b"\n", b"\n  "))
+                f.write(b"\n}\n")
+            self._store_disk_cache()
             print(f"  Saved: {filename}")
             return filename
         except Exception as e:
@@ -313,20 +572,7 @@ class MusicCastDiscovery:
         print(f"    setRepeat/setShuffle:     {'supported' if set_works else 'NOT supported'}")
         print(f"    toggleRepeat/toggleShuffle: {'supported' if toggle_works else 'NOT supported'}")
 
-        presets = self.data.get("preset_info", {})
-        named = 0
-        for key, value in presets.items():
-            if key == "response_code":
-                continue
-            if isinstance(value, list):
-                for item in value:
-                    if isinstance(item, dict) and item.get("text", "").strip():
-                        named += 1
-                    elif isinstance(item, list):
-                        for sub in item:
-                            if isinstance(sub, dict) and sub.get("text", "").strip():
-                                named += 1
-        print(f"\n  Presets: {named} named presets found")
+        print(f"\n  Presets: {self._named_preset_count} named presets found")
 
         list_info = self.data.get("list_info", {})
         for source, result in list_info.items():
@@ -342,24 +588,56 @@ class MusicCastDiscovery:
         print("  Please send the JSON file to the developer for analysis.")
         print("=" * 70)
 
-    def run(self):
-        self.print_header()
-        if not self.get_device_ip():
+    async def run(self, session=None):
+        if not self.device_ip and not self.get_device_ip():
             return False
-        if not self.test_connection():
+
+        self._load_disk_cache()
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        if session is not None:
+            return await self._run_with_session(session)
+
+        # Single keep-alive connection pool for the whole run: every probe
+        # reuses established sockets instead of paying a TCP handshake per call.
+        connector = aiohttp.TCPConnector(
+            limit=self.concurrency,
+            limit_per_host=self.concurrency,
+            keepalive_timeout=30,
+        )
+        async with aiohttp.ClientSession(connector=connector, headers=_REQUEST_HEADERS) as session:
+            return await self._run_with_session(session)
+
+    async def _run_with_session(self, session):
+        # monotonic for the duration measurement; self._start stays the one
+        # wall-clock stamp shared by the report timestamp and filename.
+        t0 = time.monotonic()
+        if not await self.test_connection(session):
             print("\n  Cannot connect to device. Check IP and connectivity.")
             return False
 
+        # The read-only info endpoints are independent of each other, so one
+        # table drives both the concurrent fetch and the in-order reporting;
+        # adding a section means adding a row, not another gather argument.
+        info_sections = (
+            ("system/getFeatures", self.collect_features),
+            ("main/getStatus", self.collect_status),
+            ("netusb/getPlayInfo", self.collect_play_info),
+            ("netusb/getPresetInfo", self.collect_preset_info),
+        )
+        responses = await asyncio.gather(
+            *(self.make_request(session, endpoint) for endpoint, _ in info_sections)
+        )
+
         self.collect_device_info()
-        self.collect_features()
-        self.collect_status()
-        self.collect_play_info()
-        self.collect_preset_info()
-        self.collect_list_info()
-        self.test_commands()
+        for (_, collect), response in zip(info_sections, responses):
+            collect(response)
+        await self.collect_list_info(session)
+        await self.test_commands(session)
 
+        self.data["duration_seconds"] = round(time.monotonic() - t0, 3)
         filename = self.save_results()
         self.print_summary()
+        print(f"\n  Discovery completed in {self.data['duration_seconds']}s")
 
         if filename:
             print(f"\n  Output file: {filename}")
@@ -367,11 +645,81 @@ class MusicCastDiscovery:
         return False
 
 
+async def _run_batch(ips, args):
+    """Discover several devices concurrently over one shared session."""
+    connector = aiohttp.TCPConnector(limit=32, limit_per_host=4, keepalive_timeout=30)
+    discoveries = []
+    for ip in ips:
+        discovery = MusicCastDiscovery(
+            exhaustive=args.exhaustive,
+            concurrency=args.concurrency,
+            output_dir=args.output_dir,
+            read_only=args.read_only,
+        )
+        if not discovery.set_device_ip(ip):
+            print(f"  Invalid IP address: {ip}")
+            return False
+        discoveries.append(discovery)
+
+    async with aiohttp.ClientSession(connector=connector, headers=_REQUEST_HEADERS) as session:
+        results = await asyncio.gather(*(d.run(session) for d in discoveries))
+    return all(results)
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Yamaha MusicCast device discovery")
+    parser.add_argument(
+        "--ip",
+        nargs="+",
+        metavar="ADDRESS",
+        help="device IP address(es); also read from MUSICCAST_IP. "
+             "Falls back to an interactive prompt when unset",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default=".",
+        help="directory for the discovery JSON report(s)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=MAX_CONCURRENT_PROBES,
+        help="maximum in-flight probe requests per device",
+    )
+    parser.add_argument(
+        "--exhaustive",
+        action="store_true",
+        help="probe every command parameter variant instead of stopping at the first working format",
+    )
+    parser.add_argument(
+        "--read-only",
+        action="store_true",
+        help="skip the command-format phase; only non-mutating get* endpoints are queried",
+    )
+    args = parser.parse_args()
+
+    ips = args.ip or os.environ.get("MUSICCAST_IP", "").replace(",", " ").split()
+    # Ordered dedupe: repeated addresses would probe the same device twice
+    # and race on its per-device cache and report files.
+    ips = list(dict.fromkeys(ips))
+
     try:
-        discovery = MusicCastDiscovery()
-        success = discovery.run()
-        input("\nPress Enter to exit...")
+        if len(ips) > 1:
+            success = asyncio.run(_run_batch(ips, args))
+        else:
+            discovery = MusicCastDiscovery(
+                exhaustive=args.exhaustive,
+                concurrency=args.concurrency,
+                output_dir=args.output_dir,
+                read_only=args.read_only,
+            )
+            discovery.print_header()
+            if ips and not discovery.set_device_ip(ips[0]):
+                print(f"  Invalid IP address: {ips[0]}")
+                sys.exit(1)
+            success = asyncio.run(discovery.run())
+        if not ips and sys.stdin.isatty():
+            input("\nPress Enter to exit...")
         if not success:
             sys.exit(1)
     except KeyboardInterrupt:
@@ -379,7 +727,8 @@ def main():
         sys.exit(1)
     except Exception as e:
         print(f"\n  Unexpected error: {e}")
-        input("\nPress Enter to exit...")
+        if not ips and sys.stdin.isatty():
+            input("\nPress Enter to exit...")
         sys.exit(1)
 
 
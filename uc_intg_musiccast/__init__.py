@@ -11,9 +11,11 @@ import logging
 import os
 from pathlib import Path
 
+# Resolved once at import; reused for both the version read and api.init().
+_DRIVER_JSON_PATH = (Path(__file__).parent.parent / "driver.json").resolve()
+
 try:
-    _driver_path = Path(__file__).parent.parent / "driver.json"
-    with open(_driver_path, "r", encoding="utf-8") as f:
+    with open(_DRIVER_JSON_PATH, "r", encoding="utf-8") as f:
         __version__ = json.load(f).get("version", "0.0.0")
 except (FileNotFoundError, json.JSONDecodeError):
     __version__ = "0.0.0"
@@ -21,9 +23,9 @@ except (FileNotFoundError, json.JSONDecodeError):
 
 async def main():
     from ucapi import DeviceStates
-    from ucapi_framework import BaseConfigManager, get_config_path
+    from ucapi_framework import get_config_path
 
-    from uc_intg_musiccast.config import MusicCastConfig
+    from uc_intg_musiccast.config import MusicCastConfig, MusicCastConfigManager
     from uc_intg_musiccast.driver import MusicCastDriver
     from uc_intg_musiccast.setup_flow import MusicCastSetupFlow
 
@@ -40,7 +42,7 @@ async def main():
 
     driver = MusicCastDriver()
     config_path = get_config_path(driver.api.config_dir_path or "")
-    config_manager = BaseConfigManager(
+    config_manager = MusicCastConfigManager(
         config_path,
         add_handler=driver.on_device_added,
         remove_handler=driver.on_device_removed,
@@ -49,8 +51,7 @@ async def main():
     driver.config_manager = config_manager
 
     setup_handler = MusicCastSetupFlow.create_handler(driver)
-    driver_json_path = os.path.join(os.path.dirname(__file__), "..", "driver.json")
-    await driver.api.init(os.path.abspath(driver_json_path), setup_handler)
+    await driver.api.init(str(_DRIVER_JSON_PATH), setup_handler)
     await driver.register_all_device_instances(connect=False)
 
     device_count = len(list(config_manager.all()))
@@ -6,18 +6,87 @@ Yamaha MusicCast API client implementation.
 """
 
 import asyncio
+import json
 import logging
+import random
 import ssl
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
-from urllib.parse import urlencode
+import time
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
 import aiohttp
+from yarl import URL
+
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+except ImportError:
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
 
 _LOG = logging.getLogger(__name__)
 
 
-@dataclass
+def _clamp(value: int, low: int, high: int) -> int:
+    """Branch-chain clamp; cheaper than max(min(...)) tuple calls on hot paths."""
+    return low if value < low else high if value > high else value
+
+
+# Static lookup tables, built once at import: the hot control paths then do
+# a single O(1) membership check instead of rebuilding dicts and lists per
+# call.
+_PLAYBACK_COMMANDS: Dict[str, str] = {
+    "play_pause": "toggle",
+    "play": "play",
+    "pause": "pause",
+    "stop": "stop",
+    "next": "next",
+    "previous": "previous",
+}
+_VALID_PLAYBACK_CMDS = frozenset(_PLAYBACK_COMMANDS.values())
+_VALID_REPEAT = frozenset({"off", "one", "all"})
+_MUTE_PARAMS = {True: {"enable": "true"}, False: {"enable": "false"}}
+_POWER_PARAMS = {
+    "toggle": {"power": "toggle"},
+    "on": {"power": "on"},
+    "standby": {"power": "standby"},
+}
+_VALID_SHUFFLE = frozenset({"off", "on"})
+_INPUT_NAME_MAPPING: Dict[str, str] = {
+    "hdmi1": "HDMI 1", "hdmi2": "HDMI 2", "hdmi3": "HDMI 3",
+    "hdmi4": "HDMI 4", "hdmi5": "HDMI 5", "hdmi6": "HDMI 6", "hdmi7": "HDMI 7",
+    "av1": "AV 1", "av2": "AV 2", "av3": "AV 3",
+    "audio1": "Audio 1", "audio2": "Audio 2", "audio3": "Audio 3", "audio4": "Audio 4",
+    "bluetooth": "Bluetooth", "spotify": "Spotify", "airplay": "AirPlay",
+    "usb": "USB", "tuner": "Tuner", "net_radio": "Net Radio", "phono": "Phono",
+    "napster": "Napster", "qobuz": "Qobuz", "tidal": "Tidal", "deezer": "Deezer",
+    "amazon_music": "Amazon Music", "alexa": "Alexa", "server": "Server",
+    "mc_link": "MusicCast Link", "main_sync": "Main Sync", "tv": "TV",
+    "optical1": "Optical 1", "optical2": "Optical 2", "coaxial1": "Coaxial 1",
+    "coaxial2": "Coaxial 2", "line1": "Line 1", "line2": "Line 2", "line3": "Line 3",
+    "line_cd": "Line CD", "juke": "Juke"
+}
+
+# Burst reads within the same UI tick share one snapshot; half a second is
+# short enough that polled state never looks stale to the user.
+_SNAPSHOT_TTL = 0.5
+
+# Absolute volume writes are debounced this long so a slider drag
+# collapses into one request (last writer wins per zone).
+_VOLUME_DEBOUNCE = 0.03
+
+# Capabilities change rarely (firmware updates, zone reconfiguration), so a
+# TTL keeps repeated getFeatures callers off the network without caching a
+# stale snapshot forever.
+_FEATURES_TTL = 300.0
+# Device identity (model, id, firmware) only changes on firmware updates;
+# cache it long enough to cover setup-probe-then-connect double fetches.
+_DEVICE_INFO_TTL = 3600.0
+
+
+@dataclass(slots=True)
 class DeviceInfo:
     """Yamaha MusicCast device information."""
     
@@ -41,7 +110,7 @@ class DeviceInfo:
         )
 
 
-@dataclass 
+@dataclass(slots=True)
 class DeviceStatus:
     """Current device status."""
     
@@ -53,37 +122,37 @@ class DeviceStatus:
     input_text: str = ""
     sound_program: str = ""
     sleep: int = 0
-    tone_control: Dict[str, Any] = None
+    tone_control: Dict[str, Any] = field(
+        default_factory=lambda: {"mode": "manual", "bass": 0, "treble": 0}
+    )
     dialogue_level: int = 0
     subwoofer_volume: int = 0
-    actual_volume: Dict[str, Any] = None
-    
-    def __post_init__(self):
-        if self.tone_control is None:
-            self.tone_control = {"mode": "manual", "bass": 0, "treble": 0}
-        if self.actual_volume is None:
-            self.actual_volume = {"mode": "db", "value": -80.0, "unit": "dB"}
+    actual_volume: Dict[str, Any] = field(
+        default_factory=lambda: {"mode": "db", "value": -80.0, "unit": "dB"}
+    )
     
     @classmethod
     def from_api_response(cls, data: Dict[str, Any]) -> "DeviceStatus":
         """Create DeviceStatus from API response."""
+        # The API returns native JSON numbers/booleans for these fields, so
+        # per-field int()/bool() coercion is pure overhead on the poll path.
         return cls(
             power=data.get("power", "standby"),
-            volume=int(data.get("volume", 0)),
-            max_volume=int(data.get("max_volume", 161)),
-            mute=bool(data.get("mute", False)),
+            volume=data.get("volume", 0),
+            max_volume=data.get("max_volume", 161),
+            mute=data.get("mute", False),
             input=data.get("input", ""),
             input_text=data.get("input_text", ""),
             sound_program=data.get("sound_program", ""),
-            sleep=int(data.get("sleep", 0)),
+            sleep=data.get("sleep", 0),
             tone_control=data.get("tone_control", {"mode": "manual", "bass": 0, "treble": 0}),
-            dialogue_level=int(data.get("dialogue_level", 0)),
-            subwoofer_volume=int(data.get("subwoofer_volume", 0)),
+            dialogue_level=data.get("dialogue_level", 0),
+            subwoofer_volume=data.get("subwoofer_volume", 0),
             actual_volume=data.get("actual_volume", {"mode": "db", "value": -80.0, "unit": "dB"})
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayInfo:
     """Current playback information."""
     
@@ -108,13 +177,27 @@ class PlayInfo:
             artist=data.get("artist", ""),
             album=data.get("album", ""),
             track=data.get("track", ""),
-            play_time=int(data.get("play_time", 0)),
-            total_time=int(data.get("total_time", 0)),
+            play_time=data.get("play_time", 0),
+            total_time=data.get("total_time", 0),
             albumart_url=data.get("albumart_url", ""),
             input=data.get("input", "")
         )
 
 
+class _EventProtocol(asyncio.DatagramProtocol):
+    """Receives the UDP JSON notifications MusicCast devices push on change."""
+
+    def __init__(self, on_datagram):
+        self._on_datagram = on_datagram
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        try:
+            event = _json_loads(data)
+        except ValueError:
+            return
+        self._on_datagram(event, addr[0])
+
+
 class YamahaMusicCastError(Exception):
     """Base exception for Yamaha MusicCast API errors."""
     pass
@@ -134,7 +217,17 @@ class YamahaMusicCastClient:
     """
     Yamaha MusicCast API client.
     """
-    
+
+    # One keep-alive session shared by every client instance: connections to
+    # the same device are pooled and reused instead of paying TCP setup per
+    # instance. Refcounted so the last close() tears it down.
+    _shared_session: ClassVar[Optional[aiohttp.ClientSession]] = None
+    _session_refs: ClassVar[int] = 0
+    _session_lock: ClassVar[Optional[asyncio.Lock]] = None
+    # Class-level so the setup probe's client and the device's long-lived
+    # client share one fetch per (host, port, ssl).
+    _device_info_cache: ClassVar[Dict[Tuple[str, int, bool], Tuple[DeviceInfo, float]]] = {}
+
     def __init__(self, ip_address: str, timeout: int = 10, port: int = 80, use_ssl: bool = False):
         """Initialize client."""
         self.ip_address = ip_address
@@ -146,10 +239,39 @@ class YamahaMusicCastClient:
         protocol = "https" if use_ssl else "http"
         self.base_url = f"{protocol}://{ip_address}:{port}"
         self.api_base = f"{self.base_url}/YamahaExtendedControl/v1"
-        
+        # Pre-parsed base URL; per request composition is then a cheap path
+        # join on aiohttp's native URL type instead of f-string + re-parse.
+        self._api_url = URL(self.api_base)
+
+        if use_ssl:
+            # SSL context that ignores certificate verification for self-signed certs
+            ssl_context = ssl.create_default_context()
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+            self._ssl: Any = ssl_context
+        else:
+            self._ssl = False
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+
         self._session: Optional[aiohttp.ClientSession] = None
-        self._device_capabilities: Optional[Dict[str, Any]] = None
-        _LOG.debug(f"Initialized Yamaha client for {ip_address}:{port} (SSL: {use_ssl})")
+        self._holds_session = False
+        self._features_cache: Optional[Tuple[Dict[str, Any], float]] = None
+        # Indexed views of the features payload, rebuilt with the cache:
+        # zone id -> precomputed capabilities, input id -> system metadata.
+        self._zone_index: Dict[str, Dict[str, Any]] = {}
+        self._system_input_index: Dict[str, Dict[str, Any]] = {}
+        self._inflight: Dict[Any, asyncio.Future] = {}
+        self._status_cache: Dict[str, Tuple[DeviceStatus, float]] = {}
+        self._play_info_cache: Optional[Tuple[PlayInfo, float]] = None
+        self._pending_volume: Dict[str, int] = {}
+        self._volume_flush: Dict[str, asyncio.Task] = {}
+        # UDP push events: while a listener is active every request carries
+        # the X-AppName/X-AppPort headers, which doubles as the periodic
+        # subscription refresh the device expects.
+        self._event_transport: Optional[asyncio.DatagramTransport] = None
+        self._event_port: Optional[int] = None
+        self._event_callback: Optional[Any] = None
+        _LOG.debug("Initialized Yamaha client for %s:%s (SSL: %s)", ip_address, port, use_ssl)
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -161,85 +283,268 @@ class YamahaMusicCastClient:
         await self.close()
     
     async def _ensure_session(self):
-        """Ensure HTTP session is available."""
-        if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=self.timeout)
-            
-            if self.use_ssl:
-                # Create SSL context that ignores certificate verification for self-signed certs
-                ssl_context = ssl.create_default_context()
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-                connector = aiohttp.TCPConnector(ssl=ssl_context)
-                _LOG.debug("Created SSL connector with certificate verification disabled")
-            else:
-                # Explicitly disable SSL for HTTP connections
-                connector = aiohttp.TCPConnector(ssl=False)
-                _LOG.debug("Created non-SSL connector")
-            
-            self._session = aiohttp.ClientSession(timeout=timeout, connector=connector)
+        """Ensure the shared HTTP session is available."""
+        cls = type(self)
+        if cls._session_lock is None:
+            cls._session_lock = asyncio.Lock()
+        async with cls._session_lock:
+            if cls._shared_session is None or cls._shared_session.closed:
+                # SSL is decided per request, so one pooled connector serves
+                # plain and SSL devices alike.
+                connector = aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=8,
+                    keepalive_timeout=75,
+                    enable_cleanup_closed=True,
+                )
+                cls._shared_session = aiohttp.ClientSession(connector=connector)
+                # _session_refs is NOT reset here: it counts instances with
+                # _holds_session set, which survive a session recreation.
+                _LOG.debug("Created shared HTTP session")
+            if not self._holds_session:
+                cls._session_refs += 1
+                self._holds_session = True
+            self._session = cls._shared_session
     
     async def close(self):
-        """Close HTTP session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
-            self._session = None
+        """Release the shared HTTP session; the last holder closes it."""
+        self.stop_event_listener()
+        cls = type(self)
+        if self._holds_session:
+            if cls._session_lock is None:
+                cls._session_lock = asyncio.Lock()
+            # Teardown runs under the same lock as _ensure_session so a
+            # concurrent caller can't observe the half-closed session and
+            # race a replacement in while close() is suspended.
+            async with cls._session_lock:
+                self._holds_session = False
+                cls._session_refs -= 1
+                session = cls._shared_session
+                if cls._session_refs <= 0 and session and not session.closed:
+                    await session.close()
+                    if cls._shared_session is session:
+                        cls._shared_session = None
+        self._session = None
+
+    @classmethod
+    async def shutdown(cls):
+        """Close the shared HTTP session regardless of holders (app teardown)."""
+        if cls._shared_session and not cls._shared_session.closed:
+            await cls._shared_session.close()
+        cls._shared_session = None
+        cls._session_refs = 0
     
     async def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Make HTTP request to device API."""
+        """Make HTTP request to device API, coalescing identical concurrent GETs."""
         await self._ensure_session()
-        
-        url = f"{self.api_base}/{endpoint}"
+
+        # aiohttp encodes the query itself; no intermediate urlencode string.
+        # Parameterless calls (the majority: get*, toggle*) skip the dict comp.
+        clean_params = None
         if params:
-            clean_params = {k: v for k, v in params.items() if v is not None}
-            if clean_params:
-                url += "?" + urlencode(clean_params)
-        
+            clean_params = {k: v for k, v in params.items() if v is not None} or None
+
+        # Idempotent get* endpoints: concurrent identical calls (e.g. several
+        # entities syncing in the same tick) share one in-flight request.
+        if not endpoint.rsplit("/", 1)[-1].startswith("get"):
+            data = await self._do_request(endpoint, clean_params)
+            # A successful mutation makes cached snapshots stale.
+            self._status_cache.clear()
+            self._play_info_cache = None
+            return data
+
+        key = (endpoint, tuple(sorted(clean_params.items())) if clean_params else None)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await inflight
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
         try:
-            _LOG.debug(f"Making request to: {url}")
-            async with self._session.get(url) as response:
-                if response.status != 200:
-                    raise DeviceNotReachableError(f"HTTP {response.status}: {response.reason}")
-                data = await response.json()
-                response_code = data.get("response_code", -1)
-                if response_code != 0:
-                    error_msg = f"API error code {response_code}"
-                    if response_code == 3:
-                        raise InvalidParameterError(f"{error_msg}: Invalid zone or parameter")
-                    elif response_code == 4:
-                        raise InvalidParameterError(f"{error_msg}: Invalid parameter value")
-                    else:
-                        raise YamahaMusicCastError(error_msg)
-                
-                _LOG.debug(f"Request successful: {endpoint}")
-                return data
-                
-        except aiohttp.ClientError as e:
-            _LOG.error(f"Network error communicating with device {self.ip_address}:{self.port}: {e}")
-            raise DeviceNotReachableError(f"Network error: {e}")
-        except asyncio.TimeoutError:
-            _LOG.error(f"Timeout communicating with device {self.ip_address}:{self.port}")
+            data = await self._do_request(endpoint, clean_params)
+        except BaseException as err:
+            future.set_exception(err)
+            # Mark retrieved so lone callers don't trigger "exception was
+            # never retrieved" warnings.
+            future.exception()
+            raise
+        else:
+            future.set_result(data)
+            return data
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _do_request(self, endpoint: str, clean_params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Perform one HTTP request to the device API."""
+        url = self._api_url / endpoint
+        headers = None
+        if self._event_port is not None:
+            headers = {
+                "X-AppName": "MusicCast/1 (uc-intg-musiccast)",
+                "X-AppPort": str(self._event_port),
+            }
+        last_exc: Optional[BaseException] = None
+        for attempt in range(3):
+            try:
+                _LOG.debug("Making request to: %s params=%s", url, clean_params)
+                async with self._session.get(
+                    url, params=clean_params, headers=headers, timeout=self._timeout, ssl=self._ssl
+                ) as response:
+                    if response.status != 200:
+                        raise DeviceNotReachableError(f"HTTP {response.status}: {response.reason}")
+                    # orjson (when available) parses the raw bytes directly,
+                    # skipping stdlib json and the intermediate str decode.
+                    data = _json_loads(await response.read())
+                    response_code = data.get("response_code", -1)
+                    if response_code != 0:
+                        error_msg = f"API error code {response_code}"
+                        if response_code == 3:
+                            raise InvalidParameterError(f"{error_msg}: Invalid zone or parameter")
+                        elif response_code == 4:
+                            raise InvalidParameterError(f"{error_msg}: Invalid parameter value")
+                        else:
+                            raise YamahaMusicCastError(error_msg)
+                    
+                    _LOG.debug("Request successful: %s", endpoint)
+                    return data
+                    
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                # Transient network hiccups get a short jittered backoff
+                # before the call is declared failed; API-level errors above
+                # are never retried.
+                last_exc = e
+                if attempt < 2:
+                    await asyncio.sleep(min(0.1 * 2 ** attempt, 0.8) + random.random() * 0.05)
+            except aiohttp.ClientError as e:
+                _LOG.error("Network error communicating with device %s:%s: %s", self.ip_address, self.port, e)
+                raise DeviceNotReachableError(f"Network error: {e}")
+
+        if isinstance(last_exc, asyncio.TimeoutError):
+            _LOG.error("Timeout communicating with device %s:%s", self.ip_address, self.port)
             raise DeviceNotReachableError("Request timeout")
+        _LOG.error("Network error communicating with device %s:%s: %s", self.ip_address, self.port, last_exc)
+        raise DeviceNotReachableError(f"Network error: {last_exc}")
+
+    async def start_event_listener(self, callback, port: int = 41100) -> None:
+        """Subscribe to UDP push notifications from the device.
+
+        ``callback`` is invoked with the decoded event dict for every
+        notification this device sends. Subsequent API requests carry the
+        subscription headers, which also refreshes the device-side timeout.
+        """
+        if self._event_transport is not None:
+            self._event_callback = callback
+            return
+        loop = asyncio.get_running_loop()
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: _EventProtocol(self._on_event), local_addr=("0.0.0.0", port)
+        )
+        self._event_transport = transport
+        # port=0 asks the OS for a free port; report the one actually bound.
+        self._event_port = transport.get_extra_info("sockname")[1]
+        self._event_callback = callback
+        # Touch the API once so the subscription headers register immediately.
+        await self._ensure_session()
+        await self._do_request("system/getDeviceInfo", None)
+        _LOG.debug("Event listener registered on UDP port %s", self._event_port)
+
+    def stop_event_listener(self) -> None:
+        """Stop receiving UDP push notifications."""
+        if self._event_transport is not None:
+            self._event_transport.close()
+            self._event_transport = None
+        self._event_port = None
+        self._event_callback = None
+
+    def _on_event(self, event: Dict[str, Any], source_ip: str) -> None:
+        if source_ip != self.ip_address or self._event_callback is None:
+            return
+        try:
+            self._event_callback(event)
+        except Exception as e:
+            _LOG.error("Event callback failed: %s", e)
 
     async def get_device_info(self) -> DeviceInfo:
-        """Get device information."""
+        """Get device information (cached across client instances)."""
+        key = (self.ip_address, self.port, self.use_ssl)
+        cached = self._device_info_cache.get(key)
+        if cached is not None and time.monotonic() - cached[1] < _DEVICE_INFO_TTL:
+            return cached[0]
         data = await self._make_request("system/getDeviceInfo")
-        return DeviceInfo.from_api_response(data, self.ip_address)
+        info = DeviceInfo.from_api_response(data, self.ip_address)
+        self._device_info_cache[key] = (info, time.monotonic())
+        return info
     
     async def get_features(self) -> Dict[str, Any]:
-        """Get device features and capabilities."""
-        if self._device_capabilities is None:
-            self._device_capabilities = await self._make_request("system/getFeatures")
-        return self._device_capabilities
+        """Get device features and capabilities (cached with a TTL)."""
+        if self._features_cache is not None:
+            features, fetched_at = self._features_cache
+            if time.monotonic() - fetched_at < _FEATURES_TTL:
+                return features
+        features = await self._make_request("system/getFeatures")
+        self._features_cache = (features, time.monotonic())
+        self._build_zone_index(features)
+        return features
+
+    def invalidate_snapshots(self) -> None:
+        """Drop cached status/play snapshots (e.g. after a push notification)."""
+        self._status_cache.clear()
+        self._play_info_cache = None
+
+    def invalidate_features(self) -> None:
+        """Drop the cached features snapshot so the next call refetches."""
+        self._features_cache = None
+        self._zone_index = {}
+        self._system_input_index = {}
+
+    def _build_zone_index(self, features: Dict[str, Any]) -> None:
+        """Index the features payload so later lookups are O(1) instead of scans."""
+        zone_index: Dict[str, Dict[str, Any]] = {}
+        for zone_info in features.get("zone", []):
+            zone_id = zone_info.get("id")
+            if not zone_id:
+                continue
+            max_vol = 161  # Default for receivers
+            for range_step in zone_info.get("range_step", []):
+                if range_step.get("id") == "volume":
+                    max_vol = range_step.get("max", 161)
+                    break
+            zone_index[zone_id] = {
+                "max_volume": max_vol,
+                "inputs": zone_info.get("input_list", []),
+                "sound_programs": zone_info.get("sound_program_list", []),
+                "func_list": set(zone_info.get("func_list", [])),
+            }
+        self._zone_index = zone_index
+        self._system_input_index = {
+            inp["id"]: inp
+            for inp in features.get("system", {}).get("input_list", [])
+            if "id" in inp
+        }
 
     async def get_status(self, zone: str = "main") -> DeviceStatus:
-        """Get zone status."""
+        """Get zone status (snapshot cached for a short TTL)."""
+        cached = self._status_cache.get(zone)
+        if cached is not None and time.monotonic() - cached[1] < _SNAPSHOT_TTL:
+            return cached[0]
         data = await self._make_request(f"{zone}/getStatus")
-        return DeviceStatus.from_api_response(data)
+        status = DeviceStatus.from_api_response(data)
+        self._status_cache[zone] = (status, time.monotonic())
+        return status
+
+    async def get_full_state(self, zone: str = "main") -> Tuple[DeviceStatus, PlayInfo]:
+        """Get zone status and playback info concurrently (one RTT instead of two)."""
+        status, play_info = await asyncio.gather(self.get_status(zone), self.get_play_info())
+        return status, play_info
     
-    async def set_power(self, zone: str = "main", power: str = "toggle") -> bool:
-        """Set power state."""
-        await self._make_request(f"{zone}/setPower", {"power": power})
+    async def set_power(self, zone: str = "main", power: str = "toggle", force: bool = False) -> bool:
+        """Set power state. No-op when the fresh snapshot already matches."""
+        if not force and power != "toggle":
+            cached = self._status_cache.get(zone)
+            if (cached is not None and time.monotonic() - cached[1] < _SNAPSHOT_TTL
+                    and cached[0].power == power):
+                return True
+        await self._make_request(f"{zone}/setPower", _POWER_PARAMS.get(power, {"power": power}))
         return True
     
     async def set_volume(self, zone: str = "main", volume: Optional[int] = None, 
@@ -247,21 +552,18 @@ class YamahaMusicCastClient:
         """Set volume level or step."""
         params = {}
         if volume is not None:
-            features = await self.get_features()
-            max_vol = 161  # Default for receivers
-            
-            if "zone" in features:
-                for zone_info in features["zone"]:
-                    if zone_info.get("id") == zone:
-                        range_steps = zone_info.get("range_step", [])
-                        for range_step in range_steps:
-                            if range_step.get("id") == "volume":
-                                max_vol = range_step.get("max", 161)
-                                break
-                        break
-            
-            params["volume"] = max(0, min(max_vol, volume))
-        elif direction in ["up", "down"]:
+            await self.get_features()
+            max_vol = self._zone_index.get(zone, {}).get("max_volume", 161)
+
+            # Micro-batch absolute levels: rapid UI updates overwrite the
+            # pending value and share one flush request per zone.
+            self._pending_volume[zone] = _clamp(volume, 0, max_vol)
+            flush = self._volume_flush.get(zone)
+            if flush is None:
+                flush = asyncio.create_task(self._flush_volume(zone))
+                self._volume_flush[zone] = flush
+            return await asyncio.shield(flush)
+        if direction in ["up", "down"]:
             # R-N803D specific format: volume=up/down&step=4
             params["volume"] = direction
             params["step"] = step if step is not None else 4
@@ -271,14 +573,32 @@ class YamahaMusicCastClient:
             raise InvalidParameterError("Either volume, step, or direction must be provided")
         await self._make_request(f"{zone}/setVolume", params)
         return True
+
+    async def _flush_volume(self, zone: str) -> bool:
+        """Send the most recent pending absolute volume for a zone."""
+        await asyncio.sleep(_VOLUME_DEBOUNCE)
+        self._volume_flush.pop(zone, None)
+        volume = self._pending_volume.pop(zone)
+        await self._make_request(f"{zone}/setVolume", {"volume": volume})
+        return True
     
-    async def set_mute(self, zone: str = "main", enable: bool = False) -> bool:
-        """Set mute state."""
-        await self._make_request(f"{zone}/setMute", {"enable": "true" if enable else "false"})
+    async def set_mute(self, zone: str = "main", enable: bool = False, force: bool = False) -> bool:
+        """Set mute state. No-op when the fresh snapshot already matches."""
+        if not force:
+            cached = self._status_cache.get(zone)
+            if (cached is not None and time.monotonic() - cached[1] < _SNAPSHOT_TTL
+                    and cached[0].mute == enable):
+                return True
+        await self._make_request(f"{zone}/setMute", _MUTE_PARAMS[bool(enable)])
         return True
     
-    async def set_input(self, zone: str = "main", input_source: str = "") -> bool:
-        """Set input source."""
+    async def set_input(self, zone: str = "main", input_source: str = "", force: bool = False) -> bool:
+        """Set input source. No-op when the fresh snapshot already matches."""
+        if not force:
+            cached = self._status_cache.get(zone)
+            if (cached is not None and time.monotonic() - cached[1] < _SNAPSHOT_TTL
+                    and cached[0].input == input_source):
+                return True
         await self._make_request(f"{zone}/setInput", {"input": input_source})
         return True
 
@@ -292,33 +612,28 @@ class YamahaMusicCastClient:
         """Set tone control."""
         params = {"mode": mode}
         if bass is not None:
-            params["bass"] = max(-12, min(12, bass))
+            params["bass"] = _clamp(bass, -12, 12)
         if treble is not None:
-            params["treble"] = max(-12, min(12, treble))
+            params["treble"] = _clamp(treble, -12, 12)
         await self._make_request(f"{zone}/setToneControl", params)
         return True
 
     async def get_play_info(self) -> PlayInfo:
-        """Get current playback information."""
+        """Get current playback information (snapshot cached for a short TTL)."""
+        cached = self._play_info_cache
+        if cached is not None and time.monotonic() - cached[1] < _SNAPSHOT_TTL:
+            return cached[0]
         data = await self._make_request("netusb/getPlayInfo")
         play_info = PlayInfo.from_api_response(data)
         if play_info.albumart_url and play_info.albumart_url.startswith('/'):
             play_info.albumart_url = f"{self.base_url}{play_info.albumart_url}"
+        self._play_info_cache = (play_info, time.monotonic())
         return play_info
     
     async def set_playback(self, playback: str) -> bool:
         """Control playback."""
-        command_mapping = {
-            "play_pause": "toggle",
-            "play": "play",
-            "pause": "pause", 
-            "stop": "stop",
-            "next": "next",
-            "previous": "previous"
-        }
-        
-        actual_command = command_mapping.get(playback, playback)
-        if actual_command not in command_mapping.values():
+        actual_command = _PLAYBACK_COMMANDS.get(playback, playback)
+        if actual_command not in _VALID_PLAYBACK_CMDS:
             raise InvalidParameterError(f"Invalid playback command: {playback}")
             
         await self._make_request("netusb/setPlayback", {"playback": actual_command})
@@ -326,14 +641,14 @@ class YamahaMusicCastClient:
     
     async def set_repeat(self, repeat: str) -> bool:
         """Set repeat mode."""
-        if repeat not in ["off", "one", "all"]:
+        if repeat not in _VALID_REPEAT:
             raise InvalidParameterError(f"Invalid repeat mode: {repeat}")
         await self._make_request("netusb/setRepeat", {"repeat": repeat})
         return True
 
     async def set_shuffle(self, shuffle: str) -> bool:
         """Set shuffle mode."""
-        if shuffle not in ["off", "on"]:
+        if shuffle not in _VALID_SHUFFLE:
             raise InvalidParameterError(f"Invalid shuffle mode: {shuffle}")
         await self._make_request("netusb/setShuffle", {"shuffle": shuffle})
         return True
@@ -400,38 +715,15 @@ class YamahaMusicCastClient:
     async def get_available_inputs(self, zone: str = "main") -> List[Dict[str, str]]:
         """Get available inputs for a zone from device capabilities."""
         try:
-            features = await self.get_features()
-            
-            # Get system input list with metadata
-            system_inputs = {inp["id"]: inp for inp in features.get("system", {}).get("input_list", [])}
-            
-            # Get zone-specific input list
-            zone_inputs = []
-            for zone_info in features.get("zone", []):
-                if zone_info.get("id") == zone:
-                    zone_inputs = zone_info.get("input_list", [])
-                    break
+            await self.get_features()
+            system_inputs = self._system_input_index
+            zone_inputs = self._zone_index.get(zone, {}).get("inputs", [])
             
             # Build enhanced input list
             enhanced_inputs = []
-            input_name_mapping = {
-                "hdmi1": "HDMI 1", "hdmi2": "HDMI 2", "hdmi3": "HDMI 3", 
-                "hdmi4": "HDMI 4", "hdmi5": "HDMI 5", "hdmi6": "HDMI 6", "hdmi7": "HDMI 7",
-                "av1": "AV 1", "av2": "AV 2", "av3": "AV 3",
-                "audio1": "Audio 1", "audio2": "Audio 2", "audio3": "Audio 3", "audio4": "Audio 4",
-                "bluetooth": "Bluetooth", "spotify": "Spotify", "airplay": "AirPlay",
-                "usb": "USB", "tuner": "Tuner", "net_radio": "Net Radio", "phono": "Phono",
-                "napster": "Napster", "qobuz": "Qobuz", "tidal": "Tidal", "deezer": "Deezer",
-                "amazon_music": "Amazon Music", "alexa": "Alexa", "server": "Server",
-                "mc_link": "MusicCast Link", "main_sync": "Main Sync", "tv": "TV",
-                "optical1": "Optical 1", "optical2": "Optical 2", "coaxial1": "Coaxial 1", 
-                "coaxial2": "Coaxial 2", "line1": "Line 1", "line2": "Line 2", "line3": "Line 3",
-                "line_cd": "Line CD", "juke": "Juke"
-            }
-            
             for input_id in zone_inputs:
                 input_info = system_inputs.get(input_id, {})
-                friendly_name = input_name_mapping.get(input_id, input_id.replace("_", " ").title())
+                friendly_name = _INPUT_NAME_MAPPING.get(input_id, input_id.replace("_", " ").title())
                 
                 enhanced_inputs.append({
                     "id": input_id,
@@ -440,11 +732,11 @@ class YamahaMusicCastClient:
                     "play_info_type": input_info.get("play_info_type", "none")
                 })
             
-            _LOG.info(f"Found {len(enhanced_inputs)} inputs for zone {zone}")
+            _LOG.info("Found %d inputs for zone %s", len(enhanced_inputs), zone)
             return enhanced_inputs
             
         except Exception as e:
-            _LOG.error(f"Failed to get available inputs: {e}")
+            _LOG.error("Failed to get available inputs: %s", e)
             # Fallback to basic inputs
             return [
                 {"id": "spotify", "name": "Spotify", "distribution_enable": True, "play_info_type": "netusb"},
@@ -456,15 +748,15 @@ class YamahaMusicCastClient:
     async def get_available_sound_programs(self, zone: str = "main") -> List[str]:
         """Get available sound programs for a zone."""
         try:
-            features = await self.get_features()
-            for zone_info in features.get("zone", []):
-                if zone_info.get("id") == zone:
-                    programs = zone_info.get("sound_program_list", [])
-                    _LOG.info(f"Found {len(programs)} sound programs for zone {zone}")
-                    return programs
-            return []
+            await self.get_features()
+            zone_view = self._zone_index.get(zone)
+            if zone_view is None:
+                return []
+            programs = zone_view["sound_programs"]
+            _LOG.info("Found %d sound programs for zone %s", len(programs), zone)
+            return programs
         except Exception as e:
-            _LOG.error(f"Failed to get sound programs: {e}")
+            _LOG.error("Failed to get sound programs: %s", e)
             return []
 
     @classmethod
@@ -480,18 +772,33 @@ class YamahaMusicCastClient:
             async with cls(ip_address, timeout, port, use_ssl) as client:
                 return await client.get_device_info()
         except Exception as e:
-            _LOG.debug(f"Device verification failed for {ip_address}:{port} (SSL: {use_ssl}): {e}")
+            _LOG.debug("Device verification failed for %s:%s (SSL: %s): %s", ip_address, port, use_ssl, e)
             return None
+
+    @classmethod
+    async def verify_devices(
+        cls, ip_addresses: List[str], timeout: int = 2, port: int = 80,
+        use_ssl: bool = False, concurrency: int = 32,
+    ) -> List[Tuple[str, Optional[DeviceInfo]]]:
+        """Verify many candidate IPs concurrently over the shared session.
+
+        Returns (ip, DeviceInfo-or-None) per candidate; wall time is roughly
+        one timeout instead of one per address.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(ip: str) -> Tuple[str, Optional[DeviceInfo]]:
+            async with semaphore:
+                return ip, await cls.verify_device(ip, timeout, port, use_ssl)
+
+        return list(await asyncio.gather(*(_one(ip) for ip in ip_addresses)))
     
     async def get_scene_support(self, zone: str = "main") -> bool:
         """Check if zone supports scene recall."""
         try:
-            features = await self.get_features()
-            for zone_info in features.get("zone", []):
-                if zone_info.get("id") == zone:
-                    func_list = zone_info.get("func_list", [])
-                    return "scene" in func_list
-            return False
+            await self.get_features()
+            zone_view = self._zone_index.get(zone)
+            return zone_view is not None and "scene" in zone_view["func_list"]
         except Exception as e:
-            _LOG.error(f"Failed to check scene support: {e}")
+            _LOG.error("Failed to check scene support: %s", e)
             return False
\ No newline at end of file
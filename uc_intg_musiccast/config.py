@@ -5,12 +5,23 @@ MusicCast configuration module.
 :license: MPL-2.0, see LICENSE for more details.
 """
 
+import asyncio
+import hashlib
+import logging
+import os
 from dataclasses import dataclass
 
 from ucapi_framework import BaseConfigManager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+_LOG = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
 class MusicCastConfig:
     identifier: str = ""
     name: str = ""
@@ -20,4 +31,77 @@ class MusicCastConfig:
 
 
 class MusicCastConfigManager(BaseConfigManager[MusicCastConfig]):
-    pass
+    """Config manager that persists through orjson when available."""
+
+    _last_saved_hash: bytes | None = None
+
+    def store(self) -> bool:
+        """Store the configuration file (orjson fast path)."""
+        if orjson is None:
+            return super().store()
+        try:
+            os.makedirs(self._data_path, exist_ok=True)
+            # orjson serializes dataclasses natively, skipping the
+            # intermediate per-device dicts a comprehension would build.
+            payload = orjson.dumps(
+                self._config, option=orjson.OPT_SERIALIZE_DATACLASS
+            )
+            # Setup retries re-save an unchanged config; skip the rewrite
+            # (and its fsync) when the payload is byte-identical.
+            digest = hashlib.blake2b(payload, digest_size=16).digest()
+            if digest == self._last_saved_hash and os.path.exists(self._cfg_file_path):
+                _LOG.debug("Configuration unchanged, skipping write")
+                return True
+            with open(self._cfg_file_path, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            self._last_saved_hash = digest
+            _LOG.debug(
+                "Stored %d device(s) to configuration file: %s",
+                len(self._config),
+                self._cfg_file_path,
+            )
+            return True
+        except OSError as err:
+            _LOG.error("Cannot write the config file: %s", err)
+            return False
+
+    def load(self) -> bool:
+        """Load the configuration from file (orjson fast path)."""
+        if orjson is None:
+            return super().load()
+        if not os.path.exists(self._cfg_file_path):
+            _LOG.info(
+                "Configuration file not found, starting with empty configuration: %s",
+                self._cfg_file_path,
+            )
+            return False
+        try:
+            with open(self._cfg_file_path, "rb") as f:
+                data = orjson.loads(f.read())
+            self._config.clear()
+            for item in data:
+                device = self.deserialize_device(item)
+                if device:
+                    self._config.append(device)
+            _LOG.info("Loaded %d device(s) from configuration", len(self._config))
+            return True
+        except OSError as err:
+            _LOG.error("Cannot read the config file %s: %s", self._cfg_file_path, err)
+        except (AttributeError, ValueError, TypeError) as err:
+            _LOG.error("Invalid config file format in %s: %s", self._cfg_file_path, err)
+        return False
+
+    async def store_async(self) -> bool:
+        """Store the configuration without blocking the event loop.
+
+        Disk writes (plus fsync) can stall for tens of milliseconds on
+        SD-card storage; callers running inside the asyncio loop should
+        prefer this over :meth:`store`.
+        """
+        return await asyncio.to_thread(self.store)
+
+    async def load_async(self) -> bool:
+        """Load the configuration without blocking the event loop."""
+        return await asyncio.to_thread(self.load)
@@ -7,6 +7,8 @@ Constants for Yamaha MusicCast integration.
 
 POLL_INTERVAL = 5
 POLL_INTERVAL_STANDBY = 15
+POLL_INTERVAL_IDLE = 15
+IDLE_POLLS_BEFORE_BACKOFF = 6
 MAX_CONSECUTIVE_FAILURES = 5
 RECONNECT_INTERVAL = 30
 DEFAULT_PORT = 80
@@ -14,8 +14,10 @@ from ucapi_framework import DeviceEvents, PollingDevice
 from uc_intg_musiccast.client import YamahaMusicCastClient
 from uc_intg_musiccast.config import MusicCastConfig
 from uc_intg_musiccast.const import (
+    IDLE_POLLS_BEFORE_BACKOFF,
     MAX_CONSECUTIVE_FAILURES,
     POLL_INTERVAL,
+    POLL_INTERVAL_IDLE,
     POLL_INTERVAL_STANDBY,
     RECONNECT_INTERVAL,
     SOUND_MODE_MAPPING,
@@ -34,6 +36,10 @@ class MusicCastDevice(PollingDevice):
         self._state: str = "UNAVAILABLE"
         self._consecutive_failures: int = 0
         self._reconnect_poll_count: int = 0
+        # Idle backoff: consecutive polls without any observable change.
+        self._idle_polls: int = 0
+        self._last_poll_sig: tuple | None = None
+        self._event_refresh_task: asyncio.Task | None = None
 
         self._power: str = "standby"
         self._volume: int = 0
@@ -236,10 +242,18 @@ class MusicCastDevice(PollingDevice):
         except Exception as err:
             _LOG.warning("[%s] Could not fetch presets: %s", self.log_id, err)
 
+        # No inline state query here: the poll loop's first iteration runs
+        # right after connect() and fetches the same snapshot, so doing it
+        # now would only delay registration by one round-trip per device.
+
+        # Push notifications make state changes near-instant; polling stays
+        # on as the subscription keepalive and fallback. An ephemeral port
+        # avoids clashes when several devices are configured.
         try:
-            await self._update_state()
-        except Exception:
-            _LOG.warning("[%s] Initial state query failed, using defaults", self.log_id)
+            await self._client.start_event_listener(self._on_push_event, port=0)
+            _LOG.info("[%s] Subscribed to UDP push events", self.log_id)
+        except OSError as err:
+            _LOG.warning("[%s] UDP event listener unavailable: %s", self.log_id, err)
 
         self._state = "ON"
         self._consecutive_failures = 0
@@ -261,8 +275,24 @@ class MusicCastDevice(PollingDevice):
             await self._update_state()
             self._consecutive_failures = 0
 
+            # Back off to the idle interval once nothing has changed for a
+            # few cycles; any delta snaps straight back to fast polling.
+            # play_time is part of the signature, so active playback never
+            # counts as idle.
+            sig = (
+                self._power, self._volume, self._muted, self._input_source,
+                self._sound_program, self._playback, self._track, self._play_time,
+            )
+            if sig == self._last_poll_sig:
+                self._idle_polls += 1
+            else:
+                self._idle_polls = 0
+                self._last_poll_sig = sig
+
             if self._power == "standby":
                 self._poll_interval = POLL_INTERVAL_STANDBY
+            elif self._idle_polls >= IDLE_POLLS_BEFORE_BACKOFF:
+                self._poll_interval = POLL_INTERVAL_IDLE
             else:
                 self._poll_interval = POLL_INTERVAL
 
@@ -285,7 +315,7 @@ class MusicCastDevice(PollingDevice):
                 self.events.emit(DeviceEvents.DISCONNECTED, self.identifier)
 
     async def _update_state(self) -> None:
-        status = await self._client.get_status()
+        status, play_info = await self._client.get_full_state()
         if status is None:
             raise ConnectionError("Failed to get device status")
 
@@ -303,7 +333,6 @@ class MusicCastDevice(PollingDevice):
             status.sound_program, status.sound_program.replace("_", " ").title()
         )
 
-        play_info = await self._client.get_play_info()
         self._playback = play_info.playback
         self._repeat = play_info.repeat
         self._shuffle = play_info.shuffle == "on"
@@ -323,6 +352,22 @@ class MusicCastDevice(PollingDevice):
             self._play_time = 0
             self._total_time = 0
 
+    def _on_push_event(self, event: dict) -> None:
+        """Handle a UDP notification: refresh state once, coalescing bursts."""
+        if "main" not in event and "netusb" not in event and "system" not in event:
+            return
+        if self._event_refresh_task is None or self._event_refresh_task.done():
+            self._event_refresh_task = asyncio.create_task(self._refresh_from_event())
+
+    async def _refresh_from_event(self) -> None:
+        try:
+            self._client.invalidate_snapshots()
+            await self._update_state()
+            self._idle_polls = 0
+            self.push_update()
+        except Exception as err:
+            _LOG.debug("[%s] Push-triggered refresh failed: %s", self.log_id, err)
+
     async def _try_reconnect(self) -> bool:
         _LOG.info("[%s] Attempting reconnection...", self.log_id)
         try:
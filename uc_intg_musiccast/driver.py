@@ -5,6 +5,7 @@ MusicCast integration driver.
 :license: MPL-2.0, see LICENSE for more details.
 """
 
+import asyncio
 import logging
 
 from ucapi_framework import BaseIntegrationDriver
@@ -18,6 +19,10 @@ from uc_intg_musiccast.select_entity import create_selects
 
 _LOG = logging.getLogger(__name__)
 
+# Upper bound for one device's connect-and-register during startup; a
+# hung device shouldn't hold the whole driver in "starting" forever.
+_REGISTER_TIMEOUT = 30
+
 
 class MusicCastDriver(BaseIntegrationDriver[MusicCastDevice, MusicCastConfig]):
     """MusicCast integration driver."""
@@ -34,3 +39,41 @@ class MusicCastDriver(BaseIntegrationDriver[MusicCastDevice, MusicCastConfig]):
             driver_id="uc-intg-musiccast",
             require_connection_before_registry=True,
         )
+
+    async def register_all_device_instances(self, connect: bool = False) -> None:
+        """Register all configured devices, connecting them concurrently.
+
+        The base implementation awaits each device in turn; with
+        ``require_connection_before_registry`` every registration includes
+        the device's capability queries, so N devices cost N round-trip
+        sets back to back. Each device only touches its own entities, so
+        the registrations can run in parallel and startup takes roughly
+        as long as the slowest device.
+        """
+        if self._config_manager is None:
+            _LOG.warning("Cannot register devices: config_manager is not set")
+            return
+
+        device_configs = list(self._config_manager.all())
+        if not device_configs:
+            return
+        if not self._require_connection_before_registry:
+            await super().register_all_device_instances(connect=connect)
+            return
+
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(
+                    self.async_add_configured_device(cfg), _REGISTER_TIMEOUT
+                )
+                for cfg in device_configs
+            ),
+            return_exceptions=True,
+        )
+        for cfg, result in zip(device_configs, results):
+            if isinstance(result, asyncio.TimeoutError):
+                _LOG.error(
+                    "Device %s did not register within %ds", cfg.identifier, _REGISTER_TIMEOUT
+                )
+            elif isinstance(result, Exception):
+                _LOG.error("Failed to register device %s: %s", cfg.identifier, result)
@@ -235,6 +235,7 @@ class MusicCastMediaPlayer(MediaPlayerEntity):
         max_line = result.get("max_line", 0)
 
         items = []
+        log_items = _LOG.isEnabledFor(logging.DEBUG)
         for idx, item in enumerate(list_items):
             text = item.get("text", "").strip()
             if not text:
@@ -242,8 +243,9 @@ class MusicCastMediaPlayer(MediaPlayerEntity):
             attr = item.get("attribute", 0)
             can_browse = (attr & 2) != 0
             can_play = True
-            _LOG.debug("Browse item: text=%s, attribute=%s, can_browse=%s, can_play=%s",
-                       text, attr, can_browse, can_play)
+            if log_items:
+                _LOG.debug("Browse item: text=%s, attribute=%s, can_browse=%s, can_play=%s",
+                           text, attr, can_browse, can_play)
 
             absolute_idx = start_index + idx
             item_path = ":".join(str(p) for p in path + [absolute_idx])
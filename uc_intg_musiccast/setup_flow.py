@@ -16,6 +16,19 @@ from uc_intg_musiccast.config import MusicCastConfig
 
 _LOG = logging.getLogger(__name__)
 
+# Reused for every device add; translate() avoids the temporary string
+# replace() builds even when no dot is present.
+_DOT_TO_UNDERSCORE = str.maketrans({".": "_"})
+
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
+
+
+def _as_bool(value: Any) -> bool:
+    """Normalize a checkbox value; the remote sends strings or bools."""
+    if isinstance(value, str):
+        return value.lower() in _TRUTHY
+    return bool(value)
+
 
 class MusicCastSetupFlow(BaseSetupFlow[MusicCastConfig]):
     """MusicCast setup flow."""
@@ -67,11 +80,7 @@ class MusicCastSetupFlow(BaseSetupFlow[MusicCastConfig]):
         address = input_values.get("address", "").strip()
         port = int(input_values.get("port", 80))
 
-        use_ssl_value = input_values.get("use_ssl", False)
-        if isinstance(use_ssl_value, str):
-            use_ssl = use_ssl_value.lower() in ("true", "1", "yes")
-        else:
-            use_ssl = bool(use_ssl_value)
+        use_ssl = _as_bool(input_values.get("use_ssl", False))
 
         if not address:
             raise ValueError("IP Address is required")
@@ -85,7 +94,7 @@ class MusicCastSetupFlow(BaseSetupFlow[MusicCastConfig]):
             raise ConnectionError(f"Could not connect to MusicCast device at {address}:{port}")
 
         device_name = name or device_info.friendly_name or "MusicCast"
-        identifier = f"musiccast_{address.replace('.', '_')}"
+        identifier = f"musiccast_{address.translate(_DOT_TO_UNDERSCORE)}"
 
         _LOG.info("Found %s (%s) at %s", device_info.model_name, device_info.device_id, address)
 